@@ -1,16 +1,48 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
-import plotly.express as px
+import plotly.graph_objects as go
 import logging
+import math
 from datetime import datetime
 
+# numexpr funde comparação e AND da máscara de datas em uma única passada
+# pela memória; é dependência opcional do pandas, então o import é guardado.
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 # Configuração de logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Linhas por página na tabela de dados detalhados
+LINHAS_POR_PAGINA = 500
+
+# Cores fixas por tipo de serviço nos gráficos
+CORES_SERVICO = {'limpeza terminal': '#1f77b4', 'limpeza concorrente': '#ff7f0e'}
+
+# Formato esperado das colunas de data ("Início Real" / "Término Real").
+# Informar o formato evita a inferência valor a valor do pd.to_datetime.
+FORMATO_DATA = '%d/%m/%Y %H:%M'
+
 # Configurações do Streamlit
 st.set_page_config(page_title="Salas Cirúrgicas", layout="wide", initial_sidebar_state="expanded")
 
-# Função para formatar minutos em HH:MM
+# Função para formatar uma Series de minutos em HH:MM de forma vetorizada
+def formatar_tempos(minutos):
+    """
+    Formata uma Series de durações em minutos como "HH:MM" em operações
+    vetorizadas (divisão inteira + concatenação de strings em uma passada).
+    Valores nulos viram "N/A".
+    """
+    # np.floor descarta a fração de minuto (durações com segundos viriam
+    # como 30.25 etc.) antes do cast, que não aceita floats não inteiros.
+    horas = np.floor(minutos / 60).astype('Int64').astype('string').str.zfill(2)
+    restantes = np.floor(minutos % 60).astype('Int64').astype('string').str.zfill(2)
+    return (horas + ':' + restantes).fillna('N/A')
+
+# Versão escalar, usada para valores avulsos como as médias dos indicadores
 def formatar_tempo_minutos(minutos):
     if pd.isna(minutos):
         return "N/A"
@@ -18,26 +50,59 @@ def formatar_tempo_minutos(minutos):
     minutos_restantes = int(minutos % 60)
     return f"{horas:02d}:{minutos_restantes:02d}"
 
-# Função para extrair nome da sala cirúrgica do campo Local de forma mais robusta
+# Função para extrair nome da sala cirúrgica do campo Local de forma vetorizada
+def extrair_salas(locais):
+    """
+    Extrai o nome da sala de uma Series de localizações de uma só vez.
+    Assume que a sala está na última parte do caminho, ex.: "SALA CIRÚRGICA 02".
+    Valores inválidos ou vazios viram "Desconhecida".
+
+    Nota: um kernel JIT (numba) varrendo os bytes em busca da última '/'
+    foi avaliado como alternativa, mas esta etapa já é desprezível frente
+    ao parse de datas e não justifica a dependência de compilação.
+    """
+    # Toda a cadeia roda em código C do pandas, sem chamar Python por linha.
+    salas = (
+        locais.astype('string')
+        .str.strip('/')
+        .str.rsplit('/', n=1)
+        .str[-1]
+        .str.strip()
+    )
+    # Strings vazias e valores nulos recebem o mesmo rótulo padrão.
+    return salas.mask(salas.str.len() == 0).fillna('Desconhecida')
+
+# Função para converter uma coluna de datas usando o formato fixo
+def converter_datas(serie):
+    """
+    Converte uma Series de datas com o formato fixo FORMATO_DATA (parser C,
+    com cache de valores repetidos). Se nada casar com o formato — por
+    exemplo, células já convertidas pelo Excel — recai na inferência antiga.
+    """
+    convertida = pd.to_datetime(serie, errors='coerce', format=FORMATO_DATA, cache=True)
+    if convertida.isna().all() and serie.notna().any():
+        convertida = pd.to_datetime(serie, errors='coerce', dayfirst=True, cache=True)
+    return convertida
+
+# Versão escalar, mantida apenas para chamadas fora de um DataFrame
 def extrair_sala(local):
     """
     Extrai o nome da sala a partir de uma string de localização.
-    Assume que a sala está na última parte do caminho, ex.: "SALA CIRÚRGICA 02".
     Retorna "Desconhecida" se o valor não for uma string válida.
     """
-    try:
-        # Verifica se o valor é uma string válida e não está vazio
-        if isinstance(local, str) and local.strip():
-            # A função .split('/') retorna uma lista. Acessamos o último item com [-1].
-            # .strip() é usado para remover espaços em branco extras no início e no fim.
-            return local.strip('/').split('/')[-1].strip()
-    except Exception as e:
-        # Loga o erro, mas continua para evitar quebra do app
-        logging.error(f"Erro ao extrair sala de '{local}': {e}")
+    if isinstance(local, str) and local.strip():
+        return local.strip('/').split('/')[-1].strip()
     return "Desconhecida"
 
-# Função para carregar dados
-@st.cache_data
+# Função para carregar dados.
+# ttl/max_entries evitam que uploads distintos acumulem no cache sem limite;
+# o hash_funcs usa o file_id (único por upload) em vez de re-hashear os
+# bytes a cada rerun.
+@st.cache_data(
+    ttl="1h",
+    max_entries=8,
+    hash_funcs={'streamlit.runtime.uploaded_file_manager.UploadedFile': lambda f: f.file_id},
+)
 def load_data(uploaded_file):
     try:
         if uploaded_file is None:
@@ -45,10 +110,21 @@ def load_data(uploaded_file):
             return None
         
         file_name = uploaded_file.name.lower()
+        usecols = ['Nº', 'Status', 'Origem', 'Serviço', 'Local', 'Início Real', 'Término Real']
+        # Tipos declarados na leitura: evita colunas object e os astype(str)
+        # que o processamento fazia depois.
+        dtypes = {'Nº': 'string', 'Status': 'string', 'Origem': 'string', 'Serviço': 'string', 'Local': 'string'}
         if file_name.endswith('.xlsx'):
-            df = pd.read_excel(uploaded_file, usecols=['Nº', 'Status', 'Origem', 'Serviço', 'Local', 'Início Real', 'Término Real'])
+            df = pd.read_excel(uploaded_file, usecols=usecols, dtype=dtypes)
         elif file_name.endswith('.csv'):
-            df = pd.read_csv(uploaded_file, usecols=['Nº', 'Status', 'Origem', 'Serviço', 'Local', 'Início Real', 'Término Real'])
+            try:
+                # O leitor Arrow é multithread e bem mais rápido que o parser C.
+                df = pd.read_csv(uploaded_file, usecols=usecols, dtype=dtypes, engine='pyarrow')
+            except Exception as e:
+                # CSVs fora do padrão que o Arrow rejeita voltam para o parser padrão.
+                logging.warning(f"Leitor pyarrow falhou ({e}); usando o parser padrão.")
+                uploaded_file.seek(0)
+                df = pd.read_csv(uploaded_file, usecols=usecols, dtype=dtypes)
         else:
             st.error(f"Formato de arquivo '{file_name}' não suportado. Use .xlsx ou .csv.")
             return None
@@ -71,48 +147,224 @@ def load_data(uploaded_file):
         return None
 
 # Função para processar dados
-@st.cache_data
+@st.cache_data(ttl="1h", max_entries=8)
 def process_data(df):
     try:
-        df = df.copy()
-        
         # --- FILTRAGEM CRÍTICA ---
-        # Certifique-se de que a coluna 'Status' e 'Serviço' existem e têm valores esperados
-        df['Status'] = df['Status'].astype(str)
-        df['Serviço'] = df['Serviço'].astype(str)
-
+        # Sem cópia inicial do DataFrame bruto: os filtros por máscara abaixo
+        # já produzem frames novos, então o df cacheado não é alterado.
+        # 'Status' e 'Serviço' já chegam como dtype string do load_data.
         # Filtra apenas status "Finalizada"
         df = df[df['Status'].str.lower() == 'finalizada']
-        
-        # Converte colunas de data
-        df['Início Real'] = pd.to_datetime(df['Início Real'], errors='coerce', dayfirst=True)
-        df['Término Real'] = pd.to_datetime(df['Término Real'], errors='coerce', dayfirst=True)
-        
-        # Extrai nome da sala cirúrgica
-        df['Sala Cirúrgica'] = df['Local'].apply(extrair_sala)
-        
-        # Normaliza tipo de serviço
-        df['Serviço'] = df['Serviço'].str.strip().str.lower()
+
+        # Normaliza tipo de serviço e mantém apenas os válidos. A cópia aqui
+        # é do frame já reduzido pelos dois filtros (bem menor que o upload)
+        # e evita o SettingWithCopyWarning nas atribuições de coluna abaixo.
+        servico = df['Serviço'].str.strip().str.lower()
         valid_services = ['limpeza terminal', 'limpeza concorrente']
-        df = df[df['Serviço'].isin(valid_services)]
-        
+        validos = servico.isin(valid_services)
+        df = df[validos].copy()
+        df['Serviço'] = servico[validos]
+
         if df.empty:
             st.warning("Nenhum dado válido encontrado após processamento e filtragem. Verifique se o arquivo tem 'Status' como 'Finalizada' e 'Serviço' como 'Limpeza Terminal' ou 'Limpeza Concorrente'.")
             return None
-        
+
+        # Converte colunas de data somente das linhas que sobraram dos filtros
+        # acima: pd.to_datetime é a etapa mais cara do processamento, então não
+        # vale a pena interpretar datas de linhas que seriam descartadas.
+        df['Início Real'] = converter_datas(df['Início Real'])
+        df['Término Real'] = converter_datas(df['Término Real'])
+
+        # Extrai nome da sala cirúrgica (vetorizado, sem loop por linha)
+        df['Sala Cirúrgica'] = extrair_salas(df['Local'])
+
         # Remove linhas com datas inválidas (NaT - Not a Time)
-        df.dropna(subset=['Início Real', 'Término Real'], inplace=True)
+        df = df.dropna(subset=['Início Real', 'Término Real'])
+
+        # Calcula duração da limpeza em minutos direto nos inteiros de
+        # nanossegundos (as linhas com NaT já foram removidas acima), sem
+        # alocar uma Series intermediária de timedelta.
+        df['Duração Minutos'] = (df['Término Real'].astype('int64') - df['Início Real'].astype('int64')) / 60_000_000_000
+        df['Duração Formatada'] = formatar_tempos(df['Duração Minutos'])
+
+        # Coluna de dia pré-calculada (e portanto cacheada pelo @st.cache_data),
+        # reutilizada pelos filtros e agrupamentos a cada rerun do Streamlit.
+        df['Dia'] = df['Início Real'].dt.floor('D')
+
+        # Poucos valores distintos: como categoria, máscaras e groupbys
+        # comparam códigos inteiros em vez de hashear strings.
+        df['Serviço'] = df['Serviço'].astype('category')
+        df['Sala Cirúrgica'] = df['Sala Cirúrgica'].astype('category')
 
-        # Calcula duração da limpeza em minutos
-        df['Duração Minutos'] = (df['Término Real'] - df['Início Real']).dt.total_seconds() / 60
-        df['Duração Formatada'] = df['Duração Minutos'].apply(formatar_tempo_minutos)
-        
         return df
     except Exception as e:
         logging.error(f"Erro ao processar dados: {e}")
         st.error(f"Erro ao processar dados: {e}. Verifique o conteúdo do arquivo.")
         return None
 
+# Função para obter os limites do seletor de datas.
+# Cacheada: as duas reduções min/max só rodam quando o arquivo muda, não a
+# cada rerun de widget.
+@st.cache_data(ttl="1h", max_entries=8)
+def obter_limites_datas(df):
+    if df['Dia'].isna().all():
+        hoje = datetime.now().date()
+        return hoje, hoje
+    return df['Dia'].min().date(), df['Dia'].max().date()
+
+# Função para aplicar os filtros da barra lateral.
+# Cacheada por (dados, intervalo, salas, tipo): reruns com os mesmos filtros
+# reaproveitam o resultado em vez de refazer as três máscaras. `salas` deve
+# ser uma tupla para a chave de cache ser hasheável.
+@st.cache_data(ttl="10m", max_entries=32)
+def filter_df(df, data_inicio, data_fim, salas, tipo):
+    # Comparação de timestamps em intervalo semiaberto, direto nos inteiros
+    # de nanossegundos da coluna 'Dia' (view, sem cópia).
+    dias = df['Dia'].to_numpy().view('i8')
+    a = np.int64(pd.Timestamp(data_inicio).value)
+    b = np.int64((pd.Timestamp(data_fim) + pd.Timedelta(days=1)).value)
+    if numexpr is not None:
+        # Kernel fundido: compara e combina as duas condições em uma passada.
+        mask = numexpr.evaluate('(dias >= a) & (dias < b)')
+    else:
+        mask = (dias >= a) & (dias < b)
+    df_filtrado = df[mask]
+
+    if salas:
+        df_filtrado = df_filtrado[df_filtrado['Sala Cirúrgica'].isin(salas)]
+
+    if tipo != 'Todos':
+        tipo_map = {'Limpeza Terminal': 'limpeza terminal', 'Limpeza Concorrente': 'limpeza concorrente'}
+        df_filtrado = df_filtrado[df_filtrado['Serviço'] == tipo_map[tipo]]
+
+    return df_filtrado
+
+# Função para escolher a resolução temporal do gráfico "Limpezas por Dia".
+# Períodos longos são reamostrados para semana ou mês: menos barras para o
+# Plotly construir e para o navegador desenhar.
+def escolher_frequencia(data_inicio, data_fim):
+    span_dias = (data_fim - data_inicio).days
+    if span_dias <= 90:
+        return 'D'
+    if span_dias <= 730:
+        return 'W'
+    return 'ME'
+
+# Função para listar as salas disponíveis no intervalo selecionado.
+# Cacheada: só recalcula quando o intervalo de datas muda, não quando o
+# usuário mexe no multiselect; o sort roda em C no NumPy.
+@st.cache_data(ttl="10m", max_entries=32)
+def listar_salas(df_interim):
+    return np.sort(df_interim['Sala Cirúrgica'].dropna().unique().astype(str)).tolist()
+
+# Função para derivar as contagens dos dois gráficos de uma única agregação.
+# Uma passada com três chaves sobre df_final; as visões por dia e por sala
+# saem de reduções sobre o resultado já agregado (bem menor que o original).
+@st.cache_data(ttl="10m", max_entries=32)
+def agrupar_limpezas(df_final, freq='D'):
+    counts = df_final.groupby(['Dia', 'Sala Cirúrgica', 'Serviço'], observed=True).size().rename('Quantidade').reset_index()
+    por_dia = counts.groupby(['Dia', 'Serviço'], as_index=False, observed=True)['Quantidade'].sum()
+    if freq != 'D':
+        por_dia = por_dia.groupby([pd.Grouper(key='Dia', freq=freq), 'Serviço'], observed=True)['Quantidade'].sum().reset_index()
+    por_sala = counts.groupby(['Sala Cirúrgica', 'Serviço'], as_index=False, observed=True)['Quantidade'].sum()
+    return por_dia, por_sala
+
+# --- Fragmentos de Renderização ---
+# Cada bloco visual é um @st.fragment: interações dentro de um fragmento
+# reexecutam apenas aquele trecho, sem reconstruir os outros gráficos.
+
+@st.fragment
+def render_indicadores(df_final):
+    st.header("📊 Indicadores")
+
+    # Calcula totais e médias por tipo de serviço em uma única passada,
+    # em vez de fatiar o DataFrame duas vezes e varrê-lo quatro vezes.
+    agg = df_final.groupby('Serviço', observed=True)['Duração Minutos'].agg(['size', 'mean'])
+
+    total_terminal = int(agg.loc['limpeza terminal', 'size']) if 'limpeza terminal' in agg.index else 0
+    media_terminal = agg.loc['limpeza terminal', 'mean'] if 'limpeza terminal' in agg.index else None
+
+    total_concorrente = int(agg.loc['limpeza concorrente', 'size']) if 'limpeza concorrente' in agg.index else 0
+    media_concorrente = agg.loc['limpeza concorrente', 'mean'] if 'limpeza concorrente' in agg.index else None
+
+    # Exibe os indicadores nas colunas
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        st.metric("Total de Limpezas Terminais", total_terminal)
+    with c2:
+        st.metric("Total de Limpezas Concorrentes", total_concorrente)
+    with c3:
+        st.metric("Duração Média Terminais", formatar_tempo_minutos(media_terminal) if pd.notnull(media_terminal) else "N/A")
+    with c4:
+        st.metric("Duração Média Concorrentes", formatar_tempo_minutos(media_concorrente) if pd.notnull(media_concorrente) else "N/A")
+
+@st.fragment
+def render_grafico_dia(limpezas_por_dia, freq='D'):
+    st.header("📅 Limpezas por Dia")
+    # Título e formato do eixo acompanham a resolução escolhida para o período.
+    rotulos_freq = {
+        'D': ("Limpezas por Dia (Terminal vs Concorrente)", "%d"),
+        'W': ("Limpezas por Semana (Terminal vs Concorrente)", "%d/%m"),
+        'ME': ("Limpezas por Mês (Terminal vs Concorrente)", "%m/%Y"),
+    }
+    titulo, tickformat = rotulos_freq[freq]
+    # Montagem direta com graph_objects: um trace por serviço, sem o
+    # pré-processamento de DataFrame que o plotly.express faz por figura.
+    fig1 = go.Figure()
+    for servico, g in limpezas_por_dia.groupby('Serviço', observed=True):
+        fig1.add_bar(x=g['Dia'], y=g['Quantidade'], name=servico, marker_color=CORES_SERVICO.get(servico), text=g['Quantidade'])
+    fig1.update_layout(
+        barmode='group',
+        template='plotly_white',
+        title=titulo,
+        xaxis_title='Dia',
+        yaxis_title='Número de Limpezas',
+        legend_title_text='Tipo de Limpeza',
+    )
+    fig1.update_xaxes(tickformat=tickformat, tickangle=45)
+    st.plotly_chart(fig1, use_container_width=True)
+
+@st.fragment
+def render_grafico_sala(limpezas_por_sala):
+    st.header("🏥 Limpezas por Sala Cirúrgica")
+    fig2 = go.Figure()
+    for servico, g in limpezas_por_sala.groupby('Serviço', observed=True):
+        fig2.add_bar(x=g['Sala Cirúrgica'], y=g['Quantidade'], name=servico, marker_color=CORES_SERVICO.get(servico), text=g['Quantidade'])
+    fig2.update_layout(
+        barmode='group',
+        template='plotly_white',
+        title="Limpezas por Sala (Terminal vs Concorrente)",
+        xaxis_title='Sala Cirúrgica',
+        yaxis_title='Número de Limpezas',
+        legend_title_text='Tipo de Limpeza',
+    )
+    fig2.update_traces(textposition='auto')
+    st.plotly_chart(fig2, use_container_width=True)
+
+# Função para gerar o CSV de exportação (cacheada: só reconverte quando o
+# DataFrame filtrado muda, não a cada rerun)
+@st.cache_data(ttl="10m", max_entries=32)
+def gerar_csv(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.fragment
+def render_tabela(df_final):
+    st.header("📋 Dados Detalhados")
+    display_columns = ['Nº', 'Status', 'Origem', 'Serviço', 'Sala Cirúrgica', 'Início Real', 'Término Real', 'Duração Formatada']
+    available_columns = [col for col in display_columns if col in df_final.columns]
+
+    # Envia ao navegador só a página pedida em vez de serializar todas as
+    # linhas; o conjunto completo fica disponível no botão de download.
+    total_paginas = max(1, math.ceil(len(df_final) / LINHAS_POR_PAGINA))
+    pagina = 1
+    if total_paginas > 1:
+        pagina = st.number_input("Página", min_value=1, max_value=total_paginas, value=1)
+    inicio = (pagina - 1) * LINHAS_POR_PAGINA
+    st.dataframe(df_final[available_columns].iloc[inicio:inicio + LINHAS_POR_PAGINA])
+    st.caption(f"Página {pagina} de {total_paginas} ({len(df_final)} registros no total).")
+    st.download_button("Baixar CSV", gerar_csv(df_final[available_columns]), "dados_limpezas.csv", "text/csv")
+
 # --- Título e Descrição ---
 st.title("🏥 Dashboard de Salas Cirúrgicas")
 st.markdown("Bem-vindo ao dashboard. Faça o upload do seu arquivo de dados para começar a análise.")
@@ -137,106 +389,36 @@ if uploaded_file:
         if df_processed is None or df_processed.empty:
             st.warning("Dados inválidos ou colunas mal formatadas. Verifique o arquivo.")
         else:
-            # Filtros de data
-            data_min = df_processed['Início Real'].min().date() if not df_processed['Início Real'].isna().all() else datetime.now().date()
-            data_max = df_processed['Início Real'].max().date() if not df_processed['Início Real'].isna().all() else datetime.now().date()
+            # Filtros de data (limites cacheados por arquivo processado)
+            data_min, data_max = obter_limites_datas(df_processed)
             data_inicio = st.sidebar.date_input("Data Início", data_min, min_value=data_min, max_value=data_max)
             data_fim = st.sidebar.date_input("Data Fim", data_max, min_value=data_min, max_value=data_max)
             
-            # Filtra o DataFrame inicial com as datas
-            df_interim = df_processed[(df_processed['Início Real'].dt.date >= data_inicio) & (df_processed['Início Real'].dt.date <= data_fim)]
+            # Filtra o DataFrame inicial apenas com as datas (cacheado)
+            df_interim = filter_df(df_processed, data_inicio, data_fim, (), 'Todos')
 
             # Apenas se df_interim não estiver vazio, preencha a lista de salas para o multiselect
             salas_disponiveis = []
             if not df_interim.empty:
-                salas_disponiveis = sorted(df_interim['Sala Cirúrgica'].dropna().unique().tolist())
-            
+                salas_disponiveis = listar_salas(df_interim)
+
             sala_selecionada = st.sidebar.multiselect("Selecione a(s) sala(s) cirúrgica(s)", salas_disponiveis)
 
             # Filtro de tipo de limpeza
             tipos_limpeza = ['Todos', 'Limpeza Terminal', 'Limpeza Concorrente']
             tipo_selecionado = st.sidebar.selectbox("Selecione o tipo de limpeza", tipos_limpeza, index=0)
 
-            # --- APLICANDO OS FILTROS AO DATAFRAME FINAL ---
-            df_final = df_interim.copy()
-            
-            if sala_selecionada:
-                df_final = df_final[df_final['Sala Cirúrgica'].isin(sala_selecionada)]
-            
-            if tipo_selecionado != 'Todos':
-                tipo_map = {'Limpeza Terminal': 'limpeza terminal', 'Limpeza Concorrente': 'limpeza concorrente'}
-                df_final = df_final[df_final['Serviço'] == tipo_map[tipo_selecionado]]
-            
-            # --- FIM DA LÓGICA DE FILTRAGEM ---
-            
+            # --- APLICANDO OS FILTROS AO DATAFRAME FINAL (cacheado) ---
+            df_final = filter_df(df_processed, data_inicio, data_fim, tuple(sorted(sala_selecionada)), tipo_selecionado)
+
             # Exibir conteúdo apenas se o dataframe final não estiver vazio
             if not df_final.empty:
-                # --- CALCULA OS INDICADORES A PARTIR DO DATAFRAME FILTRADO ---
-                st.header("📊 Indicadores")
-                
-                # Prepara dataframes para cada tipo de serviço a partir do df_final
-                df_terminal = df_final[df_final['Serviço'] == 'limpeza terminal']
-                df_concorrente = df_final[df_final['Serviço'] == 'limpeza concorrente']
-
-                # Calcula os totais e médias
-                total_terminal = len(df_terminal)
-                media_terminal = df_terminal['Duração Minutos'].mean()
-
-                total_concorrente = len(df_concorrente)
-                media_concorrente = df_concorrente['Duração Minutos'].mean()
-                
-                # Exibe os indicadores nas colunas
-                c1, c2, c3, c4 = st.columns(4)
-                with c1:
-                    st.metric("Total de Limpezas Terminais", total_terminal)
-                with c2:
-                    st.metric("Total de Limpezas Concorrentes", total_concorrente)
-                with c3:
-                    st.metric("Duração Média Terminais", formatar_tempo_minutos(media_terminal) if pd.notnull(media_terminal) else "N/A")
-                with c4:
-                    st.metric("Duração Média Concorrentes", formatar_tempo_minutos(media_concorrente) if pd.notnull(media_concorrente) else "N/A")
-                
-                # --- GRÁFICOS E TABELAS COM OS DADOS FILTRADOS ---
-                st.header("📅 Limpezas por Dia")
-                limpezas_por_dia_filtrado = df_final.groupby([df_final['Início Real'].dt.date, 'Serviço']).size().reset_index(name='Quantidade')
-                limpezas_por_dia_filtrado['Início Real'] = pd.to_datetime(limpezas_por_dia_filtrado['Início Real'])
-                
-                fig1 = px.bar(
-                    limpezas_por_dia_filtrado,
-                    x='Início Real',
-                    y='Quantidade',
-                    color='Serviço',
-                    barmode='group',
-                    labels={"Início Real": "Dia", "Quantidade": "Número de Limpezas", "Serviço": "Tipo de Limpeza"},
-                    title="Limpezas por Dia (Terminal vs Concorrente)",
-                    template="plotly_white",
-                    color_discrete_map={'limpeza terminal': '#1f77b4', 'limpeza concorrente': '#ff7f0e'},
-                    text_auto=True
-                )
-                fig1.update_xaxes(tickformat="%d", tickangle=45)
-                st.plotly_chart(fig1, use_container_width=True)
-                
-                st.header("🏥 Limpezas por Sala Cirúrgica")
-                limpezas_por_sala_filtrado = df_final.groupby(['Sala Cirúrgica', 'Serviço']).size().reset_index(name='Quantidade')
-                fig2 = px.bar(
-                    limpezas_por_sala_filtrado,
-                    x='Sala Cirúrgica',
-                    y='Quantidade',
-                    color='Serviço',
-                    barmode='group',
-                    labels={"Sala Cirúrgica": "Sala Cirúrgica", "Quantidade": "Número de Limpezas", "Serviço": "Tipo de Limpeza"},
-                    title="Limpezas por Sala (Terminal vs Concorrente)",
-                    template="plotly_white",
-                    color_discrete_map={'limpeza terminal': '#1f77b4', 'limpeza concorrente': '#ff7f0e'},
-                    text_auto=True
-                )
-                fig2.update_traces(textposition='auto')
-                st.plotly_chart(fig2, use_container_width=True)
-                
-                st.header("📋 Dados Detalhados")
-                display_columns = ['Nº', 'Status', 'Origem', 'Serviço', 'Sala Cirúrgica', 'Início Real', 'Término Real', 'Duração Formatada']
-                available_columns = [col for col in display_columns if col in df_final.columns]
-                st.dataframe(df_final[available_columns])
+                freq = escolher_frequencia(data_inicio, data_fim)
+                limpezas_por_dia, limpezas_por_sala = agrupar_limpezas(df_final, freq)
+                render_indicadores(df_final)
+                render_grafico_dia(limpezas_por_dia, freq)
+                render_grafico_sala(limpezas_por_sala)
+                render_tabela(df_final)
             else:
                 st.info("Nenhum dado disponível para os filtros selecionados.")
     else: